@@ -3,6 +3,11 @@ from abc import abstractmethod
 
 
 class _MLflowObject:
+    # Empty slots on the base class so that subclasses may declare `__slots__` of their own to
+    # drop the per-instance `__dict__`. Subclasses that don't declare `__slots__` still get a
+    # `__dict__` as usual.
+    __slots__ = ()
+
     def __iter__(self):
         # Iterate through list of properties and yield as key -> value
         for prop in self._properties():
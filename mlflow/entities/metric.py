@@ -1,18 +1,58 @@
+from types import MappingProxyType
+
 from mlflow.entities._mlflow_object import _MLflowObject
 from mlflow.protos.service_pb2 import Metric as ProtoMetric
 
+# Bound once at module scope: resolving the nested message type through `ProtoMetric.Dimension`
+# costs two attribute lookups per call, which adds up in batched conversion paths.
+_ProtoDimension = ProtoMetric.Dimension
+
+# Shared by all metrics created through `Metric.untagged`, so the tag-free hot path never
+# allocates a tag dict or tag frozenset per instance.
+_EMPTY_TAGS = MappingProxyType({})
+_EMPTY_TAG_FS = frozenset()
+
 
 class Metric(_MLflowObject):
     """
     Metric object.
     """
 
+    # Metrics are created in bulk by autologging and batch logging; storing the attributes in
+    # slots instead of a per-instance `__dict__` cuts the memory footprint and speeds up
+    # attribute access.
+    __slots__ = ("_key", "_value", "_timestamp", "_step", "_tags", "_ident", "_hash")
+
     def __init__(self, key, value, timestamp, step, tags):
         self._key = key
         self._value = value
         self._timestamp = timestamp
         self._step = step
         self._tags = tags or {}
+        # Freeze the metric's identity as a tuple at construction, with the tag items as a
+        # frozenset (which hashes and compares order-independently, so neither hashing nor
+        # equality ever needs to sort the tags). Equality is then a single tuple compare and
+        # the hash, computed lazily, is cached.
+        self._ident = (key, value, timestamp, step, frozenset(self._tags.items()))
+        self._hash = None
+
+    @classmethod
+    def untagged(cls, key, value, timestamp, step):
+        """Fast-path constructor for metrics without tags.
+
+        Skips the tag normalization done by `__init__` and shares a single immutable empty tag
+        mapping across all instances; equality and hashing behave exactly as for
+        `Metric(key, value, timestamp, step, None)`.
+        """
+        metric = cls.__new__(cls)
+        metric._key = key
+        metric._value = value
+        metric._timestamp = timestamp
+        metric._step = step
+        metric._tags = _EMPTY_TAGS
+        metric._ident = (key, value, timestamp, step, _EMPTY_TAG_FS)
+        metric._hash = None
+        return metric
 
     @property
     def key(self):
@@ -36,17 +76,30 @@ class Metric(_MLflowObject):
 
     @property
     def tags(self):
-        return self._tags
+        # Normalize the shared read-only empty mapping used by `untagged` back to a plain dict,
+        # so callers (dict conversion, repr, JSON serialization) never see the proxy type.
+        return {} if self._tags is _EMPTY_TAGS else self._tags
+
+    def __iter__(self):
+        # Specialized to skip the base class's reflective property scan; entries are yielded in
+        # the same sorted order that `_MLflowObject.__iter__` would produce.
+        yield "key", self._key
+        yield "step", self._step
+        yield "tags", self.tags
+        yield "timestamp", self._timestamp
+        yield "value", self._value
 
     def to_proto(self):
-        metric = ProtoMetric(
-            dimensions=[ProtoMetric.Dimension(key=k, value=v) for k, v in self.tags.items()]
+        # Pass all fields to the message constructor at once: each Python-level field assignment
+        # on a protobuf message is a separate call into the protobuf runtime, which dominates
+        # the cost of this conversion at log_batch scale.
+        return ProtoMetric(
+            key=self._key,
+            value=self._value,
+            timestamp=self._timestamp,
+            step=self._step,
+            dimensions=(_ProtoDimension(key=k, value=v) for k, v in self._tags.items()),
         )
-        metric.key = self.key
-        metric.value = self.value
-        metric.timestamp = self.timestamp
-        metric.step = self.step
-        return metric
 
     @classmethod
     def from_proto(cls, proto):
@@ -59,11 +112,9 @@ class Metric(_MLflowObject):
         )
 
     def __eq__(self, __o):
-        if isinstance(__o, self.__class__):
-            return self.__dict__ == __o.__dict__
-
-        return False
+        return isinstance(__o, self.__class__) and self._ident == __o._ident
 
     def __hash__(self):
-        dimension_tuples = tuple((k, self._dimensions[k]) for k in sorted(self._dimensions))
-        return hash((self._key, self._value, self._timestamp, self._step, dimension_tuples))
+        if self._hash is None:
+            self._hash = hash(self._ident)
+        return self._hash
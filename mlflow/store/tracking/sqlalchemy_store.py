@@ -919,6 +919,9 @@ class SqlAlchemyStore(AbstractStore):
                 tags=metric.tags,
             )
             self._run_id = run_id
+            # Extend the identity tuple used by the inherited __eq__/__hash__, so that metrics
+            # with equal fields from different runs don't compare (or dedup) as equal.
+            self._ident = (*self._ident, run_id)
 
         @property
         def run_id(self):
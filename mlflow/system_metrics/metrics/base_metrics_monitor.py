@@ -2,18 +2,52 @@
 import abc
 from collections import defaultdict
 
+import numpy as np
+
+# Initial per-key sample buffer capacity. Buffers grow by doubling if more samples are collected
+# between two logging steps.
+_INITIAL_BUFFER_CAPACITY = 32
+
 
 class BaseMetricsMonitor(abc.ABC):
     """Base class of system metrics monitor."""
 
     def __init__(self):
         self._metrics = defaultdict(list)
+        # Per-key sample buffers laid out as flat NumPy arrays, so that aggregating a logging
+        # cycle is a single vectorized reduction instead of a Python-level loop over lists.
+        # Buffers are kept allocated across logging cycles; `clear_metrics` only resets the
+        # per-key sample counts.
+        self._buf = {}
+        self._buf_n = defaultdict(int)
+
+    def _append_sample(self, key, value):
+        """Append one sample for `key` into its buffer, growing the buffer if necessary."""
+        n = self._buf_n[key]
+        buf = self._buf.get(key)
+        if buf is None:
+            buf = self._buf[key] = np.empty(_INITIAL_BUFFER_CAPACITY)
+        elif n == len(buf):
+            grown = np.empty(2 * len(buf))
+            grown[:n] = buf
+            buf = self._buf[key] = grown
+        buf[n] = value
+        self._buf_n[key] = n + 1
+
+    def _aggregate_mean(self):
+        """Aggregate each key's buffered samples into their mean, rounded to one decimal."""
+        return {
+            k: round(float(np.mean(self._buf[k][:n])), 1) for k, n in self._buf_n.items() if n > 0
+        }
 
     @abc.abstractmethod
-    def collect_metrics(self):
+    def collect_metrics(self, snapshot=None):
         """Method to collect metrics.
 
-        Subclass should implement this method to collect metrics and store in `self._metrics`.
+        Subclass should implement this method to collect metrics and store in `self._metrics`
+        (or in the per-key sample buffers via `self._append_sample`). `snapshot` is the shared
+        system-counter snapshot read once per sample by `SystemMetricsMonitor`; when it is
+        `None` (e.g. when a monitor is used standalone), the monitor reads the counters itself.
         """
         pass
 
@@ -27,7 +61,10 @@ class BaseMetricsMonitor(abc.ABC):
 
     @property
     def metrics(self):
+        if self._buf:
+            return {k: self._buf[k][:n].tolist() for k, n in self._buf_n.items() if n > 0}
         return self._metrics
 
     def clear_metrics(self):
         self._metrics.clear()
+        self._buf_n.clear()
@@ -8,16 +8,18 @@ from mlflow.system_metrics.metrics.base_metrics_monitor import BaseMetricsMonito
 class CPUMonitor(BaseMetricsMonitor):
     """Class for monitoring CPU stats."""
 
-    def collect_metrics(self):
+    def collect_metrics(self, snapshot=None):
         # Get CPU metrics.
-        cpu_percent = psutil.cpu_percent()
-        self._metrics["cpu_utilization_percentage"].append(cpu_percent)
+        cpu_percent = snapshot["cpu_percent"] if snapshot is not None else psutil.cpu_percent()
+        self._append_sample("cpu_utilization_percentage", cpu_percent)
 
-        system_memory = psutil.virtual_memory()
-        self._metrics["system_memory_usage_megabytes"].append(system_memory.used / 1e6)
-        self._metrics["system_memory_usage_percentage"].append(
-            system_memory.used / system_memory.total * 100
+        system_memory = (
+            snapshot["virtual_memory"] if snapshot is not None else psutil.virtual_memory()
+        )
+        self._append_sample("system_memory_usage_megabytes", system_memory.used / 1e6)
+        self._append_sample(
+            "system_memory_usage_percentage", system_memory.used / system_memory.total * 100
         )
 
     def aggregate_metrics(self):
-        return {k: round(sum(v) / len(v), 1) for k, v in self._metrics.items()}
+        return self._aggregate_mean()
@@ -10,12 +10,12 @@ from mlflow.system_metrics.metrics.base_metrics_monitor import BaseMetricsMonito
 class DiskMonitor(BaseMetricsMonitor):
     """Class for monitoring disk stats."""
 
-    def collect_metrics(self):
+    def collect_metrics(self, snapshot=None):
         # Get disk usage metrics.
-        disk_usage = psutil.disk_usage(os.sep)
-        self._metrics["disk_usage_percentage"].append(disk_usage.percent)
-        self._metrics["disk_usage_megabytes"].append(disk_usage.used / 1e6)
-        self._metrics["disk_available_megabytes"].append(disk_usage.free / 1e6)
+        disk_usage = snapshot["disk_usage"] if snapshot is not None else psutil.disk_usage(os.sep)
+        self._append_sample("disk_usage_percentage", disk_usage.percent)
+        self._append_sample("disk_usage_megabytes", disk_usage.used / 1e6)
+        self._append_sample("disk_available_megabytes", disk_usage.free / 1e6)
 
     def aggregate_metrics(self):
-        return {k: round(sum(v) / len(v), 1) for k, v in self._metrics.items()}
+        return self._aggregate_mean()
@@ -35,17 +35,18 @@ class GPUMonitor(BaseMetricsMonitor):
         self.num_gpus = pynvml.nvmlDeviceGetCount()
         self.gpu_handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(self.num_gpus)]
 
-    def collect_metrics(self):
-        # Get GPU metrics.
+    def collect_metrics(self, snapshot=None):
+        # Get GPU metrics. GPU counters come from NVML rather than the shared system snapshot,
+        # so `snapshot` is unused here.
         for i, handle in enumerate(self.gpu_handles):
             memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
-            self._metrics[f"gpu_{i}_memory_usage_percentage"].append(
-                round(memory.used / memory.total * 100, 1)
+            self._append_sample(
+                f"gpu_{i}_memory_usage_percentage", round(memory.used / memory.total * 100, 1)
             )
-            self._metrics[f"gpu_{i}_memory_usage_megabytes"].append(memory.used / 1e6)
+            self._append_sample(f"gpu_{i}_memory_usage_megabytes", memory.used / 1e6)
 
             device_utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
-            self._metrics[f"gpu_{i}_utilization_percentage"].append(device_utilization.gpu)
+            self._append_sample(f"gpu_{i}_utilization_percentage", device_utilization.gpu)
 
     def aggregate_metrics(self):
-        return {k: round(sum(v) / len(v), 1) for k, v in self._metrics.items()}
+        return self._aggregate_mean()
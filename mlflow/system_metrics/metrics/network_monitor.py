@@ -19,9 +19,11 @@ class NetworkMonitor(BaseMetricsMonitor):
         self._initial_receive_megabytes = network_usage.bytes_recv / 1e6
         self._initial_transmit_megabytes = network_usage.bytes_sent / 1e6
 
-    def collect_metrics(self):
+    def collect_metrics(self, snapshot=None):
         # Get network usage metrics.
-        network_usage = psutil.net_io_counters()
+        network_usage = (
+            snapshot["net_io_counters"] if snapshot is not None else psutil.net_io_counters()
+        )
         # Usage metrics will be the diff between current and initial metrics.
         self._metrics["network_receive_megabytes"] = (
             network_usage.bytes_recv / 1e6 - self._initial_receive_megabytes
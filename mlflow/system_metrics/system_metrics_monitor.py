@@ -1,8 +1,15 @@
 """Class for monitoring system stats."""
 
 import logging
+import os
 import threading
+import time
+from collections import ChainMap, deque
+from concurrent.futures import ThreadPoolExecutor
 
+import psutil
+
+from mlflow.entities import Metric
 from mlflow.environment_variables import (
     MLFLOW_SYSTEM_METRICS_SAMPLES_BEFORE_LOGGING,
     MLFLOW_SYSTEM_METRICS_SAMPLING_INTERVAL,
@@ -11,9 +18,15 @@ from mlflow.system_metrics.metrics.cpu_monitor import CPUMonitor
 from mlflow.system_metrics.metrics.disk_monitor import DiskMonitor
 from mlflow.system_metrics.metrics.gpu_monitor import GPUMonitor
 from mlflow.system_metrics.metrics.network_monitor import NetworkMonitor
+from mlflow.utils.time import get_current_time_millis
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of metrics batches that may be waiting for upload before further batches are
+# dropped; this bounds memory use when the tracking server is persistently slow.
+_MAX_PENDING_PUBLISHES = 32
+
 
 class SystemMetricsMonitor:
     """Class for monitoring system stats.
@@ -37,7 +50,7 @@ class SystemMetricsMonitor:
     """
 
     def __init__(self, run_id, sampling_interval=10, samples_before_logging=1):
-        from mlflow.utils.autologging_utils import BatchMetricsLogger
+        from mlflow.tracking.client import MlflowClient
 
         # Instantiate default monitors.
         self.monitors = [CPUMonitor(), DiskMonitor(), NetworkMonitor()]
@@ -55,14 +68,33 @@ class SystemMetricsMonitor:
         )
 
         self._run_id = run_id
-        self.mlflow_logger = BatchMetricsLogger(self._run_id)
-        self._shutdown_event = threading.Event()
+        self.mlflow_client = MlflowClient()
+        # The run status only needs to be approximately fresh, so cache it for a short TTL and
+        # skip the `get_run` round trip on logging cycles where the cached status is still
+        # valid. The TTL is capped at a few logging cycles so that a terminated run is still
+        # noticed promptly when logging frequently.
+        self._status_ttl = min(30.0, 3 * self.sampling_interval * self.samples_before_logging)
+        self._last_status_check = float("-inf")
+        # Shutdown is signalled through a condition variable: `wait_for` re-checks the predicate
+        # internally, so the sampling thread only resumes when shutdown was actually requested
+        # (or its timeout elapsed), not on spurious wakeups.
+        self._shutdown_cv = threading.Condition()
+        self._shutdown = False
         self._process = None
         self._logging_step = 0
+        # Uploads run on a single-worker executor so that publishing a logging cycle overlaps
+        # the next sampling cycle: the sampling thread never blocks on network I/O and the
+        # sampling cadence is unaffected by a slow tracking server.
+        self._executor = None
+        self._pending_publishes = deque()
+        self._upload_failed = False
 
     def start(self):
         """Start monitoring system metrics."""
         try:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="SystemMetricsUploader"
+            )
             self._process = threading.Thread(
                 target=self.monitor,
                 daemon=True,
@@ -73,66 +105,139 @@ class SystemMetricsMonitor:
         except Exception as e:
             _logger.warning(f"Failed to start monitoring system metrics: {e}")
             self._process = None
+            self._executor = None
 
     def monitor(self):
         """Main monitoring loop, which consistently collect and log system metrics."""
-        from mlflow.tracking.fluent import get_run
-
-        while not self._shutdown_event.is_set():
+        next_deadline = time.monotonic()
+        while not self._shutdown:
             for _ in range(self.samples_before_logging):
                 self.collect_metrics()
-                self._shutdown_event.wait(self.sampling_interval)
-                try:
-                    # Get the MLflow run to check if the run is not RUNNING.
-                    run = get_run(self._run_id)
-                except Exception as e:
-                    _logger.warning(f"Failed to get mlflow run: {e}.")
-                    return
-                if run.info.status != "RUNNING" or self._shutdown_event.is_set():
-                    # If the mlflow run is terminated or receives the shutdown signal, stop
-                    # monitoring.
-                    return
-            metrics = self.aggregate_metrics()
+                # Sleep until an absolute deadline instead of for a fixed interval, so that
+                # the sampling cadence doesn't drift by the time spent collecting metrics. The
+                # clamp resynchronizes the schedule after a stall (process suspension, an
+                # overrunning cycle): missed deadlines are skipped rather than fired
+                # back-to-back with zero timeout.
+                next_deadline = max(next_deadline + self.sampling_interval, time.monotonic())
+                with self._shutdown_cv:
+                    if self._shutdown_cv.wait_for(
+                        lambda: self._shutdown,
+                        timeout=max(0, next_deadline - time.monotonic()),
+                    ):
+                        # If we receive the shutdown signal, stop monitoring.
+                        return
             try:
-                self.publish_metrics(metrics)
+                if not self._run_is_running():
+                    # If the mlflow run is terminated, stop monitoring.
+                    return
             except Exception as e:
-                _logger.warning(
-                    f"Failed to log system metrics: {e}, this is expected if the experiment/run is "
-                    "already terminated."
-                )
+                _logger.warning(f"Failed to get mlflow run: {e}.")
                 return
+            self.publish_metrics(self.aggregate_metrics())
+
+    def _run_is_running(self):
+        """Return whether the MLflow run is still RUNNING, using a short-TTL status cache.
+
+        Reuse the client created in `__init__` so that all requests issued by this thread go
+        through the same underlying HTTP session and keep the connection alive.
+        """
+        now = time.monotonic()
+        if now - self._last_status_check < self._status_ttl:
+            # A terminated run stops the monitor immediately, so a fresh cache entry always
+            # means the run was RUNNING when last checked.
+            return True
+        run = self.mlflow_client.get_run(self._run_id)
+        self._last_status_check = now
+        return run.info.status == "RUNNING"
+
+    def _safe_publish(self, metrics, step):
+        """Upload one metrics batch on the executor, stopping the monitor on the first failure."""
+        if self._upload_failed:
+            return
+        try:
+            self._do_publish(metrics, step)
+        except Exception as e:
+            _logger.warning(
+                f"Failed to log system metrics: {e}, this is expected if the experiment/run is "
+                "already terminated."
+            )
+            self._upload_failed = True
+            self._request_shutdown()
+
+    def _request_shutdown(self):
+        with self._shutdown_cv:
+            self._shutdown = True
+            self._shutdown_cv.notify_all()
+
+    def _read_system_snapshot(self):
+        """Read all shared system counters once and return them as a dict.
+
+        Each underlying source (/proc files on Linux, the platform equivalents elsewhere) is
+        read in a single pass per sample and the snapshot is distributed to the monitors,
+        instead of every monitor issuing its own reads.
+        """
+        return {
+            "cpu_percent": psutil.cpu_percent(),
+            "virtual_memory": psutil.virtual_memory(),
+            "disk_usage": psutil.disk_usage(os.sep),
+            "net_io_counters": psutil.net_io_counters(),
+        }
 
     def collect_metrics(self):
         """Collect system metrics."""
-        metrics = {}
+        snapshot = self._read_system_snapshot()
         for monitor in self.monitors:
-            monitor.collect_metrics()
-            metrics.update(monitor._metrics)
-        return metrics
+            monitor.collect_metrics(snapshot)
+        # Metric keys are disjoint across monitors, so a ChainMap gives a merged read-only view
+        # without copying every entry into a freshly grown dict on each sample.
+        return ChainMap(*(monitor.metrics for monitor in self.monitors))
 
     def aggregate_metrics(self):
         """Aggregate collected metrics."""
-        metrics = {}
-        for monitor in self.monitors:
-            metrics.update(monitor.aggregate_metrics())
-        return metrics
+        return ChainMap(*(monitor.aggregate_metrics() for monitor in self.monitors))
 
     def publish_metrics(self, metrics):
-        """Log collected metrics to MLflow."""
-        self.mlflow_logger.record_metrics(metrics, self._logging_step)
+        """Submit collected metrics for asynchronous upload to MLflow.
+
+        The upload runs on the single-worker executor, overlapping the next sampling cycle, so
+        this never blocks the sampling thread on network I/O.
+        """
+        pending = self._pending_publishes
+        while pending and pending[0].done():
+            pending.popleft()
+        if len(pending) >= _MAX_PENDING_PUBLISHES:
+            _logger.warning("System metrics publish backlog is full, dropping one metrics batch.")
+        else:
+            pending.append(self._executor.submit(self._safe_publish, metrics, self._logging_step))
         self._logging_step += 1
         for monitor in self.monitors:
             monitor.clear_metrics()
 
+    def _do_publish(self, metrics, step):
+        """Log a batch of collected metrics to MLflow."""
+        # Send all metrics of this logging step in a single `log_batch` call (chunked to respect
+        # the REST API limit) instead of one call per metric, so that each publish costs a single
+        # round trip to the tracking server.
+        timestamp = get_current_time_millis()
+        metrics = [Metric.untagged(key, value, timestamp, step) for key, value in metrics.items()]
+        for i in range(0, len(metrics), MAX_METRICS_PER_BATCH):
+            self.mlflow_client.log_batch(
+                self._run_id, metrics=metrics[i : i + MAX_METRICS_PER_BATCH]
+            )
+
     def finish(self):
         """Stop monitoring system metrics."""
         if self._process is None:
             return
         _logger.info("Stopping system metrics monitoring...")
-        self._shutdown_event.set()
+        self._request_shutdown()
         try:
             self._process.join()
+            if self._executor is not None:
+                # Wait for any in-flight uploads to drain before returning.
+                self._executor.shutdown(wait=True)
             _logger.info("Successfully terminated system metrics monitoring!")
         except Exception as e:
             _logger.error(f"Error terminating system metrics monitoring process: {e}.")
         self._process = None
+        self._executor = None
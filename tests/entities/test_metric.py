@@ -1,3 +1,5 @@
+import json
+
 from mlflow.entities import Metric
 from mlflow.utils.time import get_current_time_millis
 
@@ -32,3 +34,38 @@ def test_creation_and_hydration():
 
     metric3 = Metric.from_dictionary(as_dict)
     _check(metric3, key, value, ts, step, dimensions)
+
+
+def test_hash_and_set_containment():
+    tagged = Metric("m", 1.0, 123, 0, {"country": "se"})
+    same_tagged = Metric("m", 1.0, 123, 0, {"country": "se"})
+    untagged = Metric("m", 1.0, 123, 0, None)
+    same_untagged = Metric("m", 1.0, 123, 0, {})
+
+    assert isinstance(hash(tagged), int)
+    assert tagged == same_tagged
+    assert hash(tagged) == hash(same_tagged)
+    assert tagged != untagged
+    assert untagged == same_untagged
+    # Equal metrics collapse in a set; distinct tags keep metrics distinct.
+    assert {tagged, same_tagged, untagged, same_untagged} == {tagged, untagged}
+    assert tagged in {same_tagged}
+    assert untagged in {same_untagged}
+
+
+def test_untagged_fast_path():
+    untagged = Metric.untagged("m", 1.0, 123, 0)
+    regular = Metric("m", 1.0, 123, 0, None)
+
+    assert untagged == regular
+    assert hash(untagged) == hash(regular)
+    assert repr(untagged) == repr(regular)
+
+    # The shared empty tag mapping never escapes through the public surface.
+    assert untagged.tags == {}
+    assert type(untagged.tags) == dict
+    assert dict(untagged) == dict(regular)
+    assert json.dumps(dict(untagged)) == json.dumps(dict(regular))
+
+    roundtrip = Metric.from_proto(untagged.to_proto())
+    assert roundtrip == untagged